@@ -0,0 +1,237 @@
+"""
+@file AsyncClient.py
+@brief Implements the asyncio client class, mirroring Client but running its requests over
+       an asyncio stream so that independent operations (e.g. backing up several files)
+       can run concurrently.
+@details The blocking Client remains available for sequential use; AsyncClient is intended
+         for workloads where several independent requests should overlap their round trips.
+@author Dmitriy Gorodov
+@id 342725405
+@date 24/01/2025
+"""
+
+import random
+import logging
+import constants
+
+from Client import Response, _RESP_HEAD
+from FileManager import FileManager
+from AsyncNetworkManager import AsyncNetworkManager
+from NetworkManager import _U32
+
+logger = logging.getLogger(__name__)
+
+class AsyncClient:
+    """
+    @class AsyncClient
+    @brief Represents an asyncio client that connects to the server and sends requests to
+           perform operations with files.
+    """
+    def __init__(self):
+        """
+        @brief Constructs an AsyncClient instance.
+        Initializes the user ID, client version, and helper managers for file and network operations.
+        The user ID is persisted to a file so every run presents the same identity to the server.
+        """
+        self.version = constants.CLIENT_VERSION
+        self.server_ip = None
+        self.server_port = None
+        self.file_manager = FileManager()
+        self.network_client = AsyncNetworkManager()
+        self.files_to_backup = []
+        user_id = self.file_manager.load_user_id(constants.USER_ID_FILE)
+        if user_id is None:
+            user_id = random.getrandbits(constants.USER_ID_LENGTH)
+            self.file_manager.save_user_id(constants.USER_ID_FILE, user_id)
+        self.user_id = user_id
+        # The list request carries no filename, so its header is a constant
+        # for this user and can be built once.
+        self._list_header = self.network_client.build_header(
+            self.user_id, self.version, constants.LIST_FILES)
+
+    def read_server_info(self, filename="server.info"):
+        """
+        @brief Reads the server IP and port from a file.
+        @param filename The path to the file containing server information (default "server.info").
+        """
+        ip, port = self.file_manager.read_server_info(filename)
+        self.server_ip = ip
+        self.server_port = port
+
+    def load_backup_files(self, filename="backup.info"):
+        """
+        @brief Loads the list of files to be backed up from a file.
+        @param filename The path to the file containing names of backup files (default "backup.info").
+        """
+        self.files_to_backup = self.file_manager.read_backup_files(filename)
+
+    async def connect(self):
+        """
+        @brief Establishes a stream connection to the server using the AsyncNetworkManager.
+        """
+        await self.network_client.connect(self.server_ip, self.server_port)
+        logger.info("Connected to %s:%s", self.server_ip, self.server_port)
+
+    async def close(self):
+        """
+        @brief Closes the stream connection.
+        """
+        await self.network_client.close()
+        logger.info("Connection closed.")
+
+    async def _send_request(self, op_code, filename=None, file_path=None):
+        """
+        @brief Sends a request header (and payload if applicable) to the server.
+        @param op_code The code describing the operation (e.g. backup, list, etc.).
+        @param filename Optional filename to send in the request header.
+        @param file_path If sending a file (e.g., backup), the local path of that file.
+        """
+        header = self.network_client.build_header(self.user_id, self.version, op_code, filename)
+        if op_code == constants.BACKUP_FILE and file_path:
+            f, file_size = self.file_manager.open_for_send(file_path)
+            with f:
+                await self.network_client.send_all(header + _U32.pack(file_size))
+                # loop.sendfile falls back to transport writes internally when
+                # the platform lacks sendfile, and rejects count=0, so empty
+                # files send no body at all.
+                if file_size > 0:
+                    await self.network_client.sendfile(f, file_size)
+        else:
+            await self.network_client.send_all(header)
+
+    async def _receive_payload_to_file(self, sink_path, size):
+        """
+        @brief Streams a payload of the given size from the stream straight to a local file.
+        @param sink_path The path of the local file to write the payload to.
+        @param size The number of payload bytes to read from the stream.
+        @return True if the whole payload was received, False if the connection
+                closed early and the written file is incomplete.
+        """
+        with open(sink_path, "wb") as f:
+            remaining = size
+            while remaining > 0:
+                chunk = await self.network_client.read_exact(min(65536, remaining))
+                if not chunk:
+                    return False
+                f.write(chunk)
+                remaining -= len(chunk)
+        return True
+
+    async def _receive_response(self, sink_path=None):
+        """
+        @brief Receives and parses the server's response header and optional payload.
+        @param sink_path Optional local path; when set, a restored file's payload is streamed
+               directly to this file instead of being buffered in memory.
+        @return A Response with the server's answer (version, status, filename, payload, etc.).
+        """
+        head = await self.network_client.read_exact(_RESP_HEAD.size)
+        if not head:
+            return None
+        server_version, status, name_len = _RESP_HEAD.unpack(head)
+
+        # The filename and (for payload-bearing statuses) the size field are
+        # fetched together in one read and sliced apart with unpack_from.
+        has_size = status in (constants.SUCCESS_FOUND, constants.SUCCESS_FILE_LIST)
+        extra = name_len + (4 if has_size else 0)
+
+        filename = None
+        size = None
+        payload = None
+        if extra > 0:
+            tail = await self.network_client.read_exact(extra)
+            if not tail:
+                return None
+            if name_len > 0:
+                filename = tail[:name_len].decode('ascii', errors='replace')
+            if has_size:
+                size = _U32.unpack_from(tail, name_len)[0]
+
+        if sink_path and status == constants.SUCCESS_FOUND and size is not None:
+            if not await self._receive_payload_to_file(sink_path, size):
+                return None
+        elif size:
+            payload = await self.network_client.read_exact(size)
+            if payload is None:
+                return None
+
+        return Response(server_version, status, name_len, filename, size, payload)
+
+    async def request_backup_file(self, file_name):
+        """
+        @brief Sends a request to back up a local file on the server.
+        @param file_name The local file path to upload to the server.
+        """
+        logger.info("--- Saving file '%s' ---", file_name)
+        await self._send_request(op_code=constants.BACKUP_FILE, filename=file_name, file_path=file_name)
+        resp = await self._receive_response()
+        logger.info("Response: %s", resp._replace(size=None, payload=None))
+
+    async def request_restore_file(self, file_name, save_as=None):
+        """
+        @brief Sends a request to retrieve a file from the server.
+        @param file_name The name of the file to retrieve from the server.
+        @param save_as Optional local file path to save the retrieved data, defaults to file_name.
+        """
+        logger.info("--- Restoring file '%s' ---", file_name)
+        if not save_as:
+            save_as = file_name
+        await self._send_request(op_code=constants.RESTORE_FILE, filename=file_name)
+        resp = await self._receive_response(sink_path=save_as)
+
+        if resp is None:
+            logger.error("Connection lost while restoring '%s'; '%s' may be incomplete.",
+                         file_name, save_as)
+            return
+        if resp.status == constants.ERR_FILE_NOT_FOUND:
+            logger.info("File '%s' not found on the server.", file_name)
+            logger.info("Response: %s", resp._replace(size=None, payload=None))
+        elif resp.status == constants.ERR_GENERAL:
+            logger.error("Fatal error: server failed to restore file.")
+            logger.info("Response: version=%s status=%s", resp.version, resp.status)
+        else:
+            logger.info("Restored '%s' to '%s'.", file_name, save_as)
+            logger.info("Response: %s", resp._replace(payload=None))
+
+    async def request_delete_file(self, file_name):
+        """
+        @brief Sends a request to delete a file from the server's storage.
+        @param file_name The name of the file to be deleted on the server.
+        """
+        logger.info("--- Deleting file '%s' ---", file_name)
+        await self._send_request(op_code=constants.DELETE_FILE, filename=file_name)
+        resp = await self._receive_response()
+
+        if resp.status == constants.ERR_FILE_NOT_FOUND:
+            logger.info("File '%s' not found on the server.", file_name)
+            logger.info("Response: %s", resp._replace(size=None, payload=None))
+        elif resp.status == constants.ERR_GENERAL:
+            logger.error("Fatal error: server failed to delete file.")
+            logger.info("Response: version=%s status=%s", resp.version, resp.status)
+        else:
+            logger.info("File deleted successfully.")
+            logger.info("Response: %s", resp._replace(size=None, payload=None))
+
+    async def request_list_files(self):
+        """
+        @brief Sends a request to the server for a list of all files belonging to the current user.
+        """
+        logger.info("--- Requesting list of files ---")
+        await self.network_client.send_all(self._list_header)
+        resp = await self._receive_response()
+
+        if resp.status == constants.ERR_NO_FILES:
+            logger.info("No files found on the server.")
+            logger.info("Response: version=%s status=%s", resp.version, resp.status)
+        elif resp.status == constants.ERR_GENERAL:
+            logger.error("Fatal error: server failed to list files.")
+            logger.info("Response: version=%s status=%s", resp.version, resp.status)
+        else:
+            logger.info("--- List of files ---")
+            if resp.payload:
+                logger.info("%s", resp.payload.decode('ascii', errors='replace'))
+
+            logger.info("--- End of list ---")
+            if logger.isEnabledFor(logging.DEBUG) and resp.payload:
+                logger.debug("Response: %s", resp._replace(payload=resp.payload.hex(' ')))
+            else:
+                logger.info("Response: %s", resp._replace(payload=None))
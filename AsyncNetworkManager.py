@@ -0,0 +1,82 @@
+"""
+@file AsyncNetworkManager.py
+@brief Asyncio counterpart of NetworkManager. Manages a stream connection to the server and
+       provides awaitable versions of the send and receive helpers.
+@details Header building is inherited from NetworkManager, so both transports share a single
+         implementation of the request protocol.
+@author Dmitriy Gorodov
+@id 342725405
+@date 24/01/2025
+"""
+
+import asyncio
+import socket
+
+from NetworkManager import NetworkManager
+
+class AsyncNetworkManager(NetworkManager):
+    """
+    @class AsyncNetworkManager
+    @brief A utility class managing an asyncio stream connection, with the same protocol
+           helpers as the blocking NetworkManager.
+    """
+    def __init__(self):
+        """
+        @brief Constructs an AsyncNetworkManager instance.
+        Initializes the stream reader and writer to None.
+        """
+        super().__init__()
+        self.reader = None
+        self.writer = None
+
+    async def connect(self, ip, port):
+        """
+        @brief Opens an asyncio stream connection to the specified IP and port.
+        @param ip The IP address of the server to connect to.
+        @param port The port number of the server to connect to.
+        """
+        self.reader, self.writer = await asyncio.open_connection(ip, port)
+        sock = self.writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+
+    async def close(self):
+        """
+        @brief Closes the stream connection if it is open.
+        """
+        if self.writer:
+            self.writer.close()
+            await self.writer.wait_closed()
+            self.reader = None
+            self.writer = None
+
+    async def send_all(self, data):
+        """
+        @brief Sends all the data over the stream connection.
+        @param data The data to be sent.
+        """
+        self.writer.write(data)
+        await self.writer.drain()
+
+    async def read_exact(self, num_bytes):
+        """
+        @brief Receives exactly the specified number of bytes from the stream connection.
+        @param num_bytes The exact number of bytes to be received.
+        @return The received data or None if the connection is closed.
+        """
+        try:
+            return await self.reader.readexactly(num_bytes)
+        except asyncio.IncompleteReadError:
+            return None
+
+    async def sendfile(self, file_obj, count):
+        """
+        @brief Sends an open file's contents over the stream connection, using zero-copy
+               sendfile on the underlying transport where available.
+        @param file_obj The open binary file object to send from.
+        @param count The number of bytes to send from the start of the file.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.sendfile(self.writer.transport, file_obj, 0, count)
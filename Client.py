@@ -11,12 +11,31 @@
 """
 
 import random
+import logging
 import struct
-import os
 import constants
 
+from typing import NamedTuple, Optional
+
 from FileManager import FileManager
-from NetworkManager import NetworkManager
+from NetworkManager import NetworkManager, _U32
+
+# Fixed 5-byte response prefix: server version, status, name_len.
+_RESP_HEAD = struct.Struct("<BHH")
+
+logger = logging.getLogger(__name__)
+
+class Response(NamedTuple):
+    """
+    @class Response
+    @brief A parsed server response: the header fields plus the optional size and payload.
+    """
+    version: int
+    status: int
+    name_len: int
+    filename: Optional[str]
+    size: Optional[int]
+    payload: Optional[bytes]
 
 class Client:
     """
@@ -27,14 +46,23 @@ class Client:
         """
         @brief Constructs a Client instance.
         Initializes the user ID, client version, and helper managers for file and network operations.
+        The user ID is persisted to a file so every run presents the same identity to the server.
         """
-        self.user_id = random.getrandbits(constants.USER_ID_LENGTH)
         self.version = constants.CLIENT_VERSION
         self.server_ip = None
         self.server_port = None
         self.file_manager = FileManager()
         self.network_client = NetworkManager()
         self.files_to_backup = []
+        user_id = self.file_manager.load_user_id(constants.USER_ID_FILE)
+        if user_id is None:
+            user_id = random.getrandbits(constants.USER_ID_LENGTH)
+            self.file_manager.save_user_id(constants.USER_ID_FILE, user_id)
+        self.user_id = user_id
+        # The list request carries no filename, so its header is a constant
+        # for this user and can be built once.
+        self._list_header = self.network_client.build_header(
+            self.user_id, self.version, constants.LIST_FILES)
 
     def read_server_info(self, filename="server.info"):
         """
@@ -57,14 +85,14 @@ class Client:
         @brief Establishes a socket connection to the server using the NetworkManager.
         """
         self.network_client.connect(self.server_ip, self.server_port)
-        print(f"Connected to {self.server_ip}:{self.server_port}")
+        logger.info("Connected to %s:%s", self.server_ip, self.server_port)
 
     def close(self):
         """
         @brief Closes the socket connection.
         """
         self.network_client.close()
-        print("Connection closed.")
+        logger.info("Connection closed.")
 
     def _send_request(self, op_code, filename=None, file_path=None):
         """
@@ -74,70 +102,108 @@ class Client:
         @param file_path If sending a file (e.g., backup), the local path of that file.
         """
         header = self.network_client.build_header(self.user_id, self.version, op_code, filename)
-        self.network_client.send_all(header)
         if op_code == constants.BACKUP_FILE and file_path:
-            file_size = os.path.getsize(file_path)
-            size_header = struct.pack("<I", file_size)
-            self.network_client.send_all(size_header)
-            for chunk in self.file_manager.read_file_chunks(file_path):
-                self.network_client.send_all(chunk)
+            f, file_size = self.file_manager.open_for_send(file_path)
+            with f:
+                self.network_client.send_vectored((header, _U32.pack(file_size)))
+                # socket.sendfile falls back to plain sends internally when the
+                # platform lacks sendfile, so any error it raises means the
+                # transfer failed mid-stream and must not be retried on this
+                # connection. It also rejects count=0, so empty files send no
+                # body at all.
+                if file_size > 0:
+                    self.network_client.sendfile(f, file_size)
+        else:
+            self.network_client.send_all(header)
 
-    def _receive_response(self):
+    def _receive_payload_to_file(self, sink_path, size):
         """
-        @brief Receives and parses the server's response header and optional payload.
-        @return A dictionary containing the server's response (version, status, filename, payload, etc.).
+        @brief Streams a payload of the given size from the socket straight to a local file.
+        @param sink_path The path of the local file to write the payload to.
+        @param size The number of payload bytes to read from the socket.
+        @return True if the whole payload was received, False if the connection
+                closed early and the written file is incomplete.
         """
-        data = self.network_client.recv_exact(1)
-        if not data:
-            return None
-        server_version = struct.unpack("<B", data)[0]
+        with open(sink_path, "wb") as f:
+            remaining = size
+            while remaining > 0:
+                chunk = self.network_client.read_exact(min(65536, remaining))
+                if not chunk:
+                    return False
+                f.write(chunk)
+                remaining -= len(chunk)
+        return True
 
-        data = self.network_client.recv_exact(2)
-        if not data:
+    def _receive_response(self, sink_path=None):
+        """
+        @brief Receives and parses the server's response header and optional payload.
+        @param sink_path Optional local path; when set, a restored file's payload is streamed
+               directly to this file instead of being buffered in memory.
+        @return A Response with the server's answer (version, status, filename, payload, etc.).
+        """
+        head = self.network_client.read_exact(_RESP_HEAD.size)
+        if not head:
             return None
-        status = struct.unpack("<H", data)[0]
+        server_version, status, name_len = _RESP_HEAD.unpack(head)
 
-        data = self.network_client.recv_exact(2)
-        if not data:
-            return None
-        name_len = struct.unpack("<H", data)[0]
+        # The filename and (for payload-bearing statuses) the size field are
+        # fetched together in one read and sliced apart with unpack_from.
+        has_size = status in (constants.SUCCESS_FOUND, constants.SUCCESS_FILE_LIST)
+        extra = name_len + (4 if has_size else 0)
 
         filename = None
-        if name_len > 0:
-            data = self.network_client.recv_exact(name_len)
-            if not data:
-                return None
-            filename = data.decode('ascii', errors='replace')
-
         size = None
         payload = None
-        if status in (constants.SUCCESS_FOUND, constants.SUCCESS_FILE_LIST):
-            data = self.network_client.recv_exact(4)
-            if not data:
+        if extra > 0:
+            tail = self.network_client.read_exact(extra)
+            if not tail:
                 return None
-            size = struct.unpack("<I", data)[0]
-            if size > 0:
-                payload = self.network_client.recv_exact(size)
-
-        return {
-            'version': server_version,
-            'status': status,
-            'name_len': name_len,
-            'filename': filename,
-            'size': size,
-            'payload': payload
-        }
+            if name_len > 0:
+                filename = tail[:name_len].decode('ascii', errors='replace')
+            if has_size:
+                size = _U32.unpack_from(tail, name_len)[0]
+
+        if sink_path and status == constants.SUCCESS_FOUND and size is not None:
+            if not self._receive_payload_to_file(sink_path, size):
+                return None
+        elif size:
+            payload = self.network_client.read_exact(size)
+            if payload is None:
+                return None
+
+        # The response has been consumed in full; the connection is back at a
+        # request boundary and may be pooled on close.
+        self.network_client.in_flight = False
+        return Response(server_version, status, name_len, filename, size, payload)
 
     def request_backup_file(self, file_name):
         """
         @brief Sends a request to back up a local file on the server.
         @param file_name The local file path to upload to the server.
         """
-        print(f"--- Saving file '{file_name}' ---")
+        logger.info("--- Saving file '%s' ---", file_name)
         self._send_request(op_code=constants.BACKUP_FILE, filename=file_name, file_path=file_name)
         resp = self._receive_response()
-        print("Response:", {k: resp[k] for k in resp if not k.startswith(('size', 'payload'))})
-        print("\n")
+        logger.info("Response: %s", resp._replace(size=None, payload=None))
+
+    def request_backup_files(self, file_names):
+        """
+        @brief Backs up several files over the existing connection, pipelined:
+               all requests are sent first and the responses are collected
+               afterwards in order, hiding all but one round trip. The server
+               answers in FIFO order since everything rides one TCP stream.
+        @param file_names The local file paths to upload to the server.
+        @return A list of Response objects, one per file, in request order.
+        """
+        for file_name in file_names:
+            logger.info("--- Saving file '%s' ---", file_name)
+            self._send_request(op_code=constants.BACKUP_FILE, filename=file_name, file_path=file_name)
+        responses = []
+        for _ in file_names:
+            resp = self._receive_response()
+            responses.append(resp)
+            logger.info("Response: %s", resp._replace(size=None, payload=None) if resp else None)
+        return responses
 
     def request_restore_file(self, file_name, save_as=None):
         """
@@ -145,66 +211,123 @@ class Client:
         @param file_name The name of the file to retrieve from the server.
         @param save_as Optional local file path to save the retrieved data, defaults to file_name.
         """
-        print(f"--- Restoring file '{file_name}' ---")
+        logger.info("--- Restoring file '%s' ---", file_name)
+        if not save_as:
+            save_as = file_name
         self._send_request(op_code=constants.RESTORE_FILE, filename=file_name)
-        resp = self._receive_response()
+        resp = self._receive_response(sink_path=save_as)
+        if resp is None:
+            logger.error("Connection lost while restoring '%s'; '%s' may be incomplete.",
+                         file_name, save_as)
+            return
+        handler = self._RESTORE_HANDLERS.get(resp.status, Client._handle_restore_ok)
+        handler(self, resp, file_name, save_as)
 
-        if resp.get('status') == constants.ERR_FILE_NOT_FOUND:
-            print(f"File '{file_name}' not found on the server.")
-            print("Response:", {k: resp[k] for k in resp if not k.startswith(('size', 'payload'))})
-        elif resp.get('status') == constants.ERR_GENERAL:
-            print("Fatal error: server failed to restore file.")
-            print("Response:", {k: resp[k] for k in ('version', 'status')})
-        else:
-            if not save_as:
-                save_as = file_name
+    def _handle_restore_not_found(self, resp, file_name, save_as):
+        """
+        @brief Reports a restore request for a file the server does not have.
+        """
+        logger.info("File '%s' not found on the server.", file_name)
+        logger.info("Response: %s", resp._replace(size=None, payload=None))
 
-            self.file_manager.write_file(save_as, resp['payload'])
-            print(f"Restored '{file_name}' to '{save_as}'.")
-            resp['payload'] = ' '.join(f"{byte:02x}" for byte in resp['payload'])
-            print("Response:", resp)
-        print("\n")
+    def _handle_restore_error(self, resp, file_name, save_as):
+        """
+        @brief Reports a fatal server error during a restore request.
+        """
+        logger.error("Fatal error: server failed to restore file.")
+        logger.info("Response: version=%s status=%s", resp.version, resp.status)
+
+    def _handle_restore_ok(self, resp, file_name, save_as):
+        """
+        @brief Reports a successfully restored (already streamed to disk) file.
+        """
+        logger.info("Restored '%s' to '%s'.", file_name, save_as)
+        logger.info("Response: %s", resp._replace(payload=None))
+
+    # Status dispatch for restore responses; anything unlisted is a success.
+    _RESTORE_HANDLERS = {
+        constants.ERR_FILE_NOT_FOUND: _handle_restore_not_found,
+        constants.ERR_GENERAL: _handle_restore_error,
+    }
 
     def request_delete_file(self, file_name):
         """
         @brief Sends a request to delete a file from the server's storage.
         @param file_name The name of the file to be deleted on the server.
         """
-        print(f"--- Deleting file '{file_name}' ---")
+        logger.info("--- Deleting file '%s' ---", file_name)
         self._send_request(op_code=constants.DELETE_FILE, filename=file_name)
         resp = self._receive_response()
+        handler = self._DELETE_HANDLERS.get(resp.status, Client._handle_delete_ok)
+        handler(self, resp, file_name)
 
-        if resp.get('status') == constants.ERR_FILE_NOT_FOUND:
-            print(f"File '{file_name}' not found on the server.")
-            print("Response:", {k: resp[k] for k in resp if not k.startswith(('size', 'payload'))})
-        elif resp.get('status') == constants.ERR_GENERAL:
-            print("Fatal error: server failed to delete file.")
-            print("Response:", {k: resp[k] for k in ('version', 'status')})
-        else:
-            print(f"File deleted successfully.")
-            print("Response:", {k: resp[k] for k in resp if not k.startswith(('size', 'payload'))})
-        print("\n")
+    def _handle_delete_not_found(self, resp, file_name):
+        """
+        @brief Reports a delete request for a file the server does not have.
+        """
+        logger.info("File '%s' not found on the server.", file_name)
+        logger.info("Response: %s", resp._replace(size=None, payload=None))
+
+    def _handle_delete_error(self, resp, file_name):
+        """
+        @brief Reports a fatal server error during a delete request.
+        """
+        logger.error("Fatal error: server failed to delete file.")
+        logger.info("Response: version=%s status=%s", resp.version, resp.status)
+
+    def _handle_delete_ok(self, resp, file_name):
+        """
+        @brief Reports a successfully deleted file.
+        """
+        logger.info("File deleted successfully.")
+        logger.info("Response: %s", resp._replace(size=None, payload=None))
+
+    # Status dispatch for delete responses; anything unlisted is a success.
+    _DELETE_HANDLERS = {
+        constants.ERR_FILE_NOT_FOUND: _handle_delete_not_found,
+        constants.ERR_GENERAL: _handle_delete_error,
+    }
 
     def request_list_files(self):
         """
         @brief Sends a request to the server for a list of all files belonging to the current user.
         """
-        print("--- Requesting list of files ---")
-        self._send_request(op_code=constants.LIST_FILES)
+        logger.info("--- Requesting list of files ---")
+        self.network_client.send_all(self._list_header)
         resp = self._receive_response()
+        handler = self._LIST_HANDLERS.get(resp.status, Client._handle_list_ok)
+        handler(self, resp)
 
-        if resp.get('status') == constants.ERR_NO_FILES:
-            print("No files found on the server.")
-            print("Response:", {k: resp[k] for k in ('version', 'status')})
-        elif resp.get('status') == constants.ERR_GENERAL:
-            print("Fatal error: server failed to list files.")
-            print("Response:", {k: resp[k] for k in ('version', 'status')})
+    def _handle_list_empty(self, resp):
+        """
+        @brief Reports a list request when the user has no files on the server.
+        """
+        logger.info("No files found on the server.")
+        logger.info("Response: version=%s status=%s", resp.version, resp.status)
+
+    def _handle_list_error(self, resp):
+        """
+        @brief Reports a fatal server error during a list request.
+        """
+        logger.error("Fatal error: server failed to list files.")
+        logger.info("Response: version=%s status=%s", resp.version, resp.status)
+
+    def _handle_list_ok(self, resp):
+        """
+        @brief Prints the received file list and the response details.
+        """
+        logger.info("--- List of files ---")
+        if resp.payload:
+            logger.info("%s", resp.payload.decode('ascii', errors='replace'))
+
+        logger.info("--- End of list ---")
+        if logger.isEnabledFor(logging.DEBUG) and resp.payload:
+            logger.debug("Response: %s", resp._replace(payload=resp.payload.hex(' ')))
         else:
-            print("--- List of files ---")
-            if resp['payload']:
-                print(resp['payload'].decode('ascii', errors='replace'))
-
-            print("--- End of list ---")
-            resp['payload'] = ' '.join(f"{byte:02x}" for byte in resp['payload'])
-            print("Response:", resp)
-        print("\n")
+            logger.info("Response: %s", resp._replace(payload=None))
+
+    # Status dispatch for list responses; anything unlisted is a success.
+    _LIST_HANDLERS = {
+        constants.ERR_NO_FILES: _handle_list_empty,
+        constants.ERR_GENERAL: _handle_list_error,
+    }
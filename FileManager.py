@@ -9,6 +9,11 @@
 @date 24/01/2025
 """
 
+import os
+import constants
+
+from pathlib import Path
+
 class FileManager:
     """
     @class FileManager
@@ -21,9 +26,8 @@ class FileManager:
         @param filename The path to the file containing server info in the format "ip:port".
         @return A tuple (ip, port) representing the server address information.
         """
-        with open(filename, "r") as f:
-            line = f.read().strip()
-        ip_part, port_part = line.split(":")
+        line = Path(filename).read_text(encoding='ascii')
+        ip_part, _, port_part = line.rstrip().rpartition(":")
         return ip_part, int(port_part)
 
     def read_backup_files(self, filename):
@@ -32,10 +36,41 @@ class FileManager:
         @param filename The path to the file containing filenames (one per line).
         @return A list of filenames.
         """
-        with open(filename, "r") as f:
-            return f.read().strip().split("\n")
+        lines = Path(filename).read_text(encoding='ascii').splitlines()
+        return [name for name in (line.strip() for line in lines) if name]
+
+    def load_user_id(self, filename):
+        """
+        @brief Reads a previously saved user ID from a file.
+        @param filename The path to the file holding the decimal user ID.
+        @return The user ID as an int, or None if the file is missing or invalid.
+        """
+        try:
+            with open(filename, "r") as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+
+    def save_user_id(self, filename, user_id):
+        """
+        @brief Saves a user ID to a file so later sessions reuse the same identity.
+        @param filename The path to the file to write the user ID to.
+        @param user_id The user ID to persist.
+        """
+        with open(filename, "w") as f:
+            f.write(str(user_id))
+
+    def open_for_send(self, file_path):
+        """
+        @brief Opens a file for sending and determines its size from the open descriptor,
+               avoiding a separate stat call (and the race between it and the read).
+        @param file_path The path to the file to be sent.
+        @return A tuple (file object, size in bytes); the caller is responsible for closing the file.
+        """
+        f = open(file_path, "rb")
+        return f, os.fstat(f.fileno()).st_size
 
-    def read_file_chunks(self, file_path, chunk_size=4096):
+    def read_file_chunks(self, file_path, chunk_size=constants.BACKUP_CHUNK_SIZE):
         """
         @brief Yields chunks of binary data from a file.
         @param file_path The path to the file to be read.
@@ -9,9 +9,40 @@
 @date 24/01/2025
 """
 
+import atexit
 import socket
 import struct
 
+# Precompiled structs for the fixed-width protocol fields. Compiling the
+# format once and reusing the Struct avoids re-parsing the format string
+# on every pack/unpack call.
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+# Fixed 8-byte request header: user_id, version, op_code, name_len.
+_HDR = struct.Struct("<IBBH")
+
+# Idle connections kept warm for reuse, keyed by (ip, port) and capped per
+# address; reusing them skips the TCP handshake and keeps the congestion
+# window from restarting in slow-start.
+_POOL = {}
+_POOL_CAP = 4
+
+def close_all_pooled():
+    """
+    @brief Closes every pooled idle connection. Registered to run at process exit.
+    """
+    for connections in _POOL.values():
+        for sock, rfile in connections:
+            try:
+                rfile.close()
+                sock.close()
+            except OSError:
+                pass
+    _POOL.clear()
+
+atexit.register(close_all_pooled)
+
 class NetworkManager:
     """
     @class NetworkManager
@@ -23,31 +54,106 @@ class NetworkManager:
         Initializes the socket to None.
         """
         self.sock = None
+        self._rfile = None
+        self._addr = None
+        # True while a request has been sent but its response not yet fully
+        # consumed; such connections must not be pooled.
+        self.in_flight = False
+        # Encoded-filename cache: the same names recur across backup,
+        # restore and delete requests in one session.
+        self._name_cache = {}
 
     def connect(self, ip, port):
         """
-        @brief Establishes a socket connection to the specified IP and port.
+        @brief Establishes a socket connection to the specified IP and port,
+               reusing a pooled warm connection to that address when one exists.
         @param ip The IP address of the server to connect to.
         @param port The port number of the server to connect to.
         """
+        self._addr = (ip, port)
+        pooled = _POOL.get(self._addr)
+        if pooled:
+            self.sock, self._rfile = pooled.pop()
+            return
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.sock.connect((ip, port))
+        # Disable Nagle so small request headers are not held back waiting
+        # for an ACK, and enlarge the send buffer so large backup chunks
+        # stream at wire rate.
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        # Buffered reader over the socket: one large recv services many of
+        # the small fixed-width header reads.
+        self._rfile = self.sock.makefile('rb', buffering=65536)
 
     def close(self):
         """
-        @brief Closes the socket connection if it is open.
+        @brief Releases the connection if it is open. Connections that sit at a
+               request boundary are returned to the pool for reuse (up to the
+               per-address cap); anything mid-exchange is closed instead.
         """
         if self.sock:
-            self.sock.close()
+            connections = _POOL.setdefault(self._addr, [])
+            if self._safe_to_pool() and len(connections) < _POOL_CAP:
+                connections.append((self.sock, self._rfile))
+            else:
+                self._rfile.close()
+                self.sock.close()
             self.sock = None
+            self._rfile = None
+
+    def _safe_to_pool(self):
+        """
+        @brief Checks that the connection is at a request boundary: no request is
+               mid-exchange and the peer has no unread bytes or pending close waiting.
+        @return True if the connection may safely be reused by another client.
+        """
+        if self.in_flight:
+            return False
+        try:
+            self.sock.setblocking(False)
+            try:
+                self.sock.recv(1, socket.MSG_PEEK)
+            finally:
+                self.sock.setblocking(True)
+        except (BlockingIOError, InterruptedError):
+            return True
+        except OSError:
+            return False
+        # recv succeeded: either the peer closed or it sent bytes nobody
+        # consumed - both make the connection unsafe to hand out again.
+        return False
 
     def send_all(self, data):
         """
         @brief Sends all the data over the socket connection.
         @param data The data to be sent.
         """
+        self.in_flight = True
         self.sock.sendall(data)
 
+    def send_vectored(self, buffers):
+        """
+        @brief Sends several buffers back to back with one vectored sendmsg syscall
+               where available, falling back to a single concatenated sendall.
+        @param buffers A sequence of bytes-like objects to send.
+        """
+        self.in_flight = True
+        if not hasattr(self.sock, "sendmsg"):
+            self.send_all(b"".join(buffers))
+            return
+        views = [memoryview(b) for b in buffers]
+        while views:
+            sent = self.sock.sendmsg(views)
+            # Advance past whatever the kernel accepted; sendmsg may stop
+            # short of the full iovec.
+            while views and sent >= len(views[0]):
+                sent -= len(views[0])
+                views.pop(0)
+            if sent:
+                views[0] = views[0][sent:]
+
     def recv(self, size):
         """
         @brief Receives data from the socket connection.
@@ -62,13 +168,35 @@ class NetworkManager:
         @param num_bytes The exact number of bytes to be received.
         @return The received data or None if the connection is closed.
         """
-        buf = b''
-        while len(buf) < num_bytes:
-            chunk = self.sock.recv(num_bytes - len(buf))
-            if not chunk:
+        buf = bytearray(num_bytes)
+        view = memoryview(buf)
+        received = 0
+        while received < num_bytes:
+            n = self.sock.recv_into(view[received:], num_bytes - received)
+            if not n:
                 return None
-            buf += chunk
-        return buf
+            received += n
+        return bytes(buf)
+
+    def read_exact(self, num_bytes):
+        """
+        @brief Reads exactly the specified number of bytes through the buffered reader.
+        @param num_bytes The exact number of bytes to be read.
+        @return The received data or None if the connection closed early.
+        """
+        data = self._rfile.read(num_bytes)
+        if data is None or len(data) < num_bytes:
+            return None
+        return data
+
+    def sendfile(self, file_obj, count):
+        """
+        @brief Sends an open file's contents over the socket using os.sendfile where
+               available, copying straight from the page cache to the socket buffer.
+        @param file_obj The open binary file object to send from.
+        @param count The number of bytes to send from the start of the file.
+        """
+        self.sock.sendfile(file_obj, 0, count)
 
     def build_header(self, user_id, version, op_code, filename=None):
         """
@@ -79,13 +207,15 @@ class NetworkManager:
         @param filename Optional filename to include in the header.
         @return The constructed header as bytes.
         """
-        header = struct.pack("<I", user_id)
-        header += struct.pack("<B", version)
-        header += struct.pack("<B", op_code)
         if filename:
-            encoded_filename = filename.encode('ascii')
-            header += struct.pack("<H", len(encoded_filename))
-            header += encoded_filename
+            encoded_filename = self._name_cache.get(filename)
+            if encoded_filename is None:
+                encoded_filename = filename.encode('ascii')
+                self._name_cache[filename] = encoded_filename
         else:
-            header += struct.pack("<H", 0)
-        return header
\ No newline at end of file
+            encoded_filename = b''
+        buf = bytearray(_HDR.size + len(encoded_filename))
+        _HDR.pack_into(buf, 0, user_id, version, op_code, len(encoded_filename))
+        if encoded_filename:
+            buf[_HDR.size:] = encoded_filename
+        return bytes(buf)
\ No newline at end of file
@@ -11,6 +11,10 @@
 CLIENT_VERSION = 1
 # User ID length in bits
 USER_ID_LENGTH = 32
+# Size (in bytes) of each chunk read from a file while backing it up
+BACKUP_CHUNK_SIZE = 262144
+# File in which the generated user ID is persisted between runs
+USER_ID_FILE = "client.info"
 
 # Request Codes
 BACKUP_FILE = 100
@@ -2,56 +2,79 @@
 @file main.py
 @brief This file contains the main program that demonstrates the client simulation. It connects to the server and send the requests to perform operations with files.
        It reads the server information, connects to the server, loads backup files, requests list of files, saves and restores files, deletes files and finishes the work.
+@details Backups of independent files run concurrently over one connection per file using
+         AsyncClient, so the total backup time is bounded by the slowest file rather than
+         the sum of all round trips. The blocking Client remains available for sequential use.
 @author Dmitriy Gorodov
 @id 342725405
 @date 24/01/2025
 """
 
-from Client import Client
+import asyncio
+import logging
 
-def main():
+from AsyncClient import AsyncClient
+
+async def backup_files_concurrently(client, file_names):
+    """
+    @brief Backs up the given files concurrently, one connection per file.
+    @param client The main AsyncClient whose user ID and server address are reused.
+    @param file_names The local file paths to upload to the server.
+    """
+    async def backup_one(file_name):
+        worker = AsyncClient()
+        worker.user_id = client.user_id
+        worker.server_ip = client.server_ip
+        worker.server_port = client.server_port
+        await worker.connect()
+        try:
+            await worker.request_backup_file(file_name)
+        finally:
+            await worker.close()
+
+    await asyncio.gather(*(backup_one(name) for name in file_names))
+
+async def main():
     # Step 1: generate unique ID by default
-    client = Client()
+    client = AsyncClient()
     try:
         # Step 2: read server info and connect
         client.read_server_info()
-        client.connect()
+        await client.connect()
 
         # Step 3: load backup files from file “backup.info”
         client.load_backup_files()
 
         # Step 4: request to display the list of files on the server
-        client.request_list_files()
+        await client.request_list_files()
 
-        # Step 5: read first file from the file “backup.info” and save it on the server
+        # Steps 5-6: save the files from “backup.info” on the server, overlapping
+        # their round trips by running the uploads concurrently
         if len(client.files_to_backup) > 0:
-            client.request_backup_file(client.files_to_backup[0])
-
-        # Step 6: read second file from the file “backup.info” and save it on the server
-        if len(client.files_to_backup) > 1:
-            client.request_backup_file(client.files_to_backup[1])
+            await backup_files_concurrently(client, client.files_to_backup[:2])
 
         # Step 7: request to display the list of files on the server
-        client.request_list_files()
+        await client.request_list_files()
 
         # Step 8: retrieve the first file from the server and save it as "tmp" file on the client side
         if len(client.files_to_backup) > 0:
-            client.request_restore_file(client.files_to_backup[0], "tmp")
+            await client.request_restore_file(client.files_to_backup[0], "tmp")
 
         # Step 9: delete first file from the server
         if len(client.files_to_backup) > 0:
-            client.request_delete_file(client.files_to_backup[0])
+            await client.request_delete_file(client.files_to_backup[0])
 
         # Step 10: retrieve first file from the server again
         if len(client.files_to_backup) > 0:
-            client.request_restore_file(client.files_to_backup[0])
+            await client.request_restore_file(client.files_to_backup[0])
 
         # Step 11: end the work and close the connection
         print("Client work completed.")
     except Exception as e:
         print(f"Unexpected error: {e}")
     finally:
-        client.close()
+        await client.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(main())